@@ -11,8 +11,15 @@ class Config:
     MIN_TRADE_AMOUNT = 100
     MAX_TRADE_AMOUNT = 500
     BATCH_SIZE = 10
+    BATCH_SLOT_SECONDS = 30  # spacing between batch entries (matches the old send delay)
     RISK_THRESHOLD = 70  # percentage
     
+    # Telegram limits
+    MAX_MESSAGE_LENGTH = 4096  # characters per message
+    MESSAGE_INTERVAL = 1.0  # seconds between messages to the same chat
+    GLOBAL_MESSAGE_RATE = 28  # messages per second across all chats
+    MAX_CHAT_LIMITERS = 2048  # most recently active chats with their own limiter
+    
     # Crypto IDX settings
     CRYPTO_IDX_SYMBOL = "CRYPTO_IDX"
     
@@ -1,13 +1,16 @@
 import asyncio
 import logging
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.request import HTTPXRequest
 from config import Config
 from signal_generator import SignalGenerator
 from risk_manager import RiskManager
 from trade_history import TradeHistory
-import pytz
+from send import safe_reply
+from tz import IST
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +19,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ENTRY_DELTA = timedelta(minutes=4)  # Entry is placed 4 minutes ahead
+BATCH_SLOT_DELTA = timedelta(seconds=Config.BATCH_SLOT_SECONDS)
+BATCH_SEPARATOR = "\n\n---\n\n"
+
+SIGNAL_TEMPLATE = (
+    "{direction} **Crypto IDX Signal**\n"
+    "\n"
+    "⏰ **Entry Time**: {entry}\n"
+    "⏱️ **Trade Duration**: {duration} minutes\n"
+    "🎯 **Expiry Time**: {expiry}\n"
+    "💰 **Suggested Amount**: ₹{amount}\n"
+    "📊 **Confidence**: {confidence}%\n"
+    "📈 **Volatility**: {volatility}\n"
+    "⚠️ **Risk Level**: {risk_level}\n"
+    "\n"
+    "{risk_warning}\n"
+    "\n"
+    "**Action**: Place {duration}-minute trade before {entry}"
+).format
+RISK_ACCEPTABLE = "✅ **Risk**: Acceptable"
+
+DIRECTION_LABELS = {'UP': "📈 UP", 'DOWN': "📉 DOWN"}
+VOLATILITY_EDGES = (0.3, 0.7)
+VOLATILITY_LABELS = ("Low", "Medium", "High")
+
+def chunk_messages(messages, separator, limit=None):
+    """Join messages into as few chunks as possible, each within Telegram's length limit"""
+    limit = limit or Config.MAX_MESSAGE_LENGTH
+    chunks = []
+    current = ""
+    for message in messages:
+        candidate = f"{current}{separator}{message}" if current else message
+        if current and len(candidate) > limit:
+            chunks.append(current)
+            current = message
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
 class CryptoIDXBot:
     def __init__(self):
         self.signal_generator = SignalGenerator()
@@ -40,7 +84,7 @@ Welcome! This bot provides AI-powered trading signals for Crypto IDX.
 
 **Important:** Trading involves risk. Only trade what you can afford to lose.
         """
-        await update.message.reply_text(welcome_message, parse_mode='Markdown')
+        await safe_reply(update.message, welcome_message, parse_mode='Markdown')
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Send a message when the command /help is issued."""
@@ -71,16 +115,16 @@ Welcome! This bot provides AI-powered trading signals for Crypto IDX.
 📈 **Volatility**: Low/Medium/High
 ⚠️ **Risk Level**: Low/Medium/High
         """
-        await update.message.reply_text(help_text, parse_mode='Markdown')
+        await safe_reply(update.message, help_text, parse_mode='Markdown')
 
     async def signal_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Generate and send a trading signal."""
         try:
             signal = await self.generate_signal()
-            await update.message.reply_text(signal, parse_mode='Markdown')
+            await safe_reply(update.message, signal, parse_mode='Markdown')
         except Exception as e:
             logger.error(f"Error generating signal: {e}")
-            await update.message.reply_text("❌ Error generating signal. Please try again.")
+            await safe_reply(update.message, "❌ Error generating signal. Please try again.")
 
     async def batch_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start batch trading mode."""
@@ -89,18 +133,21 @@ Welcome! This bot provides AI-powered trading signals for Crypto IDX.
             self.active_batch = []
             
         if len(self.active_batch) >= Config.BATCH_SIZE:
-            await update.message.reply_text("📋 Batch complete! Use /batch to start new batch.")
+            await safe_reply(update.message, "📋 Batch complete! Use /batch to start new batch.")
             return
             
-        await update.message.reply_text(f"🔄 Starting batch mode... {Config.BATCH_SIZE - len(self.active_batch)} trades remaining")
+        await safe_reply(update.message, f"🔄 Starting batch mode... {Config.BATCH_SIZE - len(self.active_batch)} trades remaining")
         
-        for i in range(Config.BATCH_SIZE - len(self.active_batch)):
-            signal = await self.generate_signal()
-            await update.message.reply_text(signal, parse_mode='Markdown')
-            self.active_batch.append(signal)
-            
-            if i < Config.BATCH_SIZE - 1:
-                await asyncio.sleep(30)  # 30 second delay between signals
+        # Each batch trade gets its own entry slot, keeping the old 30s cadence
+        signals = [
+            await self.generate_signal(slot)
+            for slot in range(Config.BATCH_SIZE - len(self.active_batch))
+        ]
+        self.active_batch.extend(signals)
+        
+        # Send the batch in as few messages as Telegram's length limit allows
+        for message in chunk_messages(signals, BATCH_SEPARATOR):
+            await safe_reply(update.message, message, parse_mode='Markdown')
                 
         self.batch_count += len(self.active_batch)
 
@@ -108,23 +155,25 @@ Welcome! This bot provides AI-powered trading signals for Crypto IDX.
         """Show trade history."""
         history = self.trade_history.get_recent_trades(5)
         if not history:
-            await update.message.reply_text("📊 No trade history yet.")
+            await safe_reply(update.message, "📊 No trade history yet.")
             return
             
         history_text = "📈 **Recent Trades:**\n\n"
         for trade in history:
             history_text += f"{trade}\n\n"
             
-        await update.message.reply_text(history_text, parse_mode='Markdown')
+        await safe_reply(update.message, history_text, parse_mode='Markdown')
 
-    async def generate_signal(self):
-        """Generate a comprehensive trading signal with dynamic duration."""
+    async def generate_signal(self, slot=0):
+        """
+        Generate a comprehensive trading signal with dynamic duration.
+        slot: position within a batch; each slot enters BATCH_SLOT_SECONDS later
+        """
         # Get current time in IST
-        ist = pytz.timezone(Config.TIMEZONE)
-        current_time = datetime.now(ist)
+        current_time = datetime.now(IST)
         
-        # Generate signal data
-        signal_data = self.signal_generator.generate_signal()
+        # Generate signal data off the event loop so other handlers stay responsive
+        signal_data = await asyncio.to_thread(self.signal_generator.generate_signal)
         risk_assessment = self.risk_manager.assess_risk(signal_data)
         
         # Determine trade amount
@@ -134,13 +183,13 @@ Welcome! This bot provides AI-powered trading signals for Crypto IDX.
         )
         
         # Format signal message
-        direction = "📈 UP" if signal_data['direction'] == 'UP' else "📉 DOWN"
+        direction = DIRECTION_LABELS[signal_data['direction']]
         confidence = signal_data['confidence']
         duration = signal_data['duration']
         volatility = signal_data['volatility']
         
-        # Calculate entry time (next 4 minutes)
-        entry_time = current_time + timedelta(minutes=4)
+        # Calculate entry time (next 4 minutes, plus the batch slot offset)
+        entry_time = current_time + ENTRY_DELTA + slot * BATCH_SLOT_DELTA
         entry_str = entry_time.strftime("%H:%M IST")
         
         # Calculate expiry time
@@ -148,37 +197,32 @@ Welcome! This bot provides AI-powered trading signals for Crypto IDX.
         expiry_str = expiry_time.strftime("%H:%M IST")
         
         # Risk warning
-        risk_warning = ""
+        risk_warning = RISK_ACCEPTABLE
         if confidence < Config.RISK_THRESHOLD:
             risk_warning = f"⚠️ **WARNING**: Low confidence signal ({confidence}%)"
         
         # Volatility indicator
-        volatility_text = "Low" if volatility < 0.3 else "Medium" if volatility < 0.7 else "High"
-        
-        signal_message = f"""
-{direction} **Crypto IDX Signal**
-
-⏰ **Entry Time**: {entry_str}
-⏱️ **Trade Duration**: {duration} minutes
-🎯 **Expiry Time**: {expiry_str}
-💰 **Suggested Amount**: ₹{suggested_amount}
-📊 **Confidence**: {confidence}%
-📈 **Volatility**: {volatility_text}
-⚠️ **Risk Level**: {risk_assessment['risk_level']}
-
-{risk_warning if risk_warning else "✅ **Risk**: Acceptable"}
-
-**Action**: Place {duration}-minute trade before {entry_str}
-        """
+        volatility_text = VOLATILITY_LABELS[bisect_right(VOLATILITY_EDGES, volatility)]
         
-        return signal_message.strip()
+        return SIGNAL_TEMPLATE(
+            direction=direction,
+            entry=entry_str,
+            duration=duration,
+            expiry=expiry_str,
+            amount=suggested_amount,
+            confidence=confidence,
+            volatility=volatility_text,
+            risk_level=risk_assessment['risk_level'],
+            risk_warning=risk_warning
+        )
 
     async def error_handler(self, update: object, context: ContextTypes.DEFAULT_TYPE):
         """Log errors and notify user."""
         logger.error(msg="Exception while handling an update:", exc_info=context.error)
         
         if isinstance(update, Update) and update.effective_message:
-            await update.effective_message.reply_text(
+            await safe_reply(
+                update.effective_message,
                 "❌ An error occurred. The bot is still running. Please try again."
             )
 
@@ -189,7 +233,18 @@ def main() -> None:
         return
         
     bot = CryptoIDXBot()
-    application = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
+    
+    # Pooled HTTP/2 connections so consecutive replies reuse one TLS session;
+    # long polling gets its own client so it never holds up outgoing sends
+    request = HTTPXRequest(connection_pool_size=16, http_version='2', read_timeout=20, connect_timeout=10)
+    get_updates_request = HTTPXRequest(http_version='2', read_timeout=20, connect_timeout=10)
+    application = (
+        Application.builder()
+        .token(Config.TELEGRAM_BOT_TOKEN)
+        .request(request)
+        .get_updates_request(get_updates_request)
+        .build()
+    )
     
     # Add handlers
     application.add_handler(CommandHandler("start", bot.start))
@@ -1,6 +1,15 @@
 from config import Config
+from bisect import bisect_right
 import math
 
+# Confidence thresholds and the position multiplier for each band below/above them
+CONFIDENCE_EDGES = (60, 70, 80, 90)
+POSITION_MULTIPLIERS = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+# Confidence thresholds and the (risk level, risk score) for each band below/above them
+RISK_EDGES = (65, 75, 85)
+RISK_LEVELS = (("Very High", 4), ("High", 3), ("Medium", 2), ("Low", 1))
+
 class RiskManager:
     def __init__(self):
         self.max_daily_loss = 2000  # Maximum daily loss in ₹
@@ -8,6 +17,21 @@ class RiskManager:
         self.loss_streak = 0
         self.daily_loss = 0
         
+        # Position sizes per confidence band, normal and during a loss streak
+        self._position_sizes = (
+            tuple(self._position_amount(m) for m in POSITION_MULTIPLIERS),
+            tuple(self._position_amount(m * 0.5) for m in POSITION_MULTIPLIERS)
+        )
+        
+    @staticmethod
+    def _position_amount(multiplier):
+        """Trade amount for a multiplier, rounded to the nearest 50 and kept within bounds"""
+        base_amount = Config.MIN_TRADE_AMOUNT
+        max_amount = Config.MAX_TRADE_AMOUNT
+        amount = base_amount + (max_amount - base_amount) * multiplier
+        amount = round(amount / 50) * 50
+        return max(Config.MIN_TRADE_AMOUNT, min(Config.MAX_TRADE_AMOUNT, int(amount)))
+        
     def assess_risk(self, signal_data):
         """
         Assess risk level for a given signal
@@ -16,18 +40,7 @@ class RiskManager:
         confidence = signal_data['confidence']
         
         # Risk levels based on confidence
-        if confidence >= 85:
-            risk_level = "Low"
-            risk_score = 1
-        elif confidence >= 75:
-            risk_level = "Medium"
-            risk_score = 2
-        elif confidence >= 65:
-            risk_level = "High"
-            risk_score = 3
-        else:
-            risk_level = "Very High"
-            risk_score = 4
+        risk_level, risk_score = RISK_LEVELS[bisect_right(RISK_EDGES, confidence)]
             
         # Adjust for loss streak
         if self.loss_streak >= 2:
@@ -45,33 +58,8 @@ class RiskManager:
         """
         Calculate appropriate position size based on risk assessment
         """
-        base_amount = Config.MIN_TRADE_AMOUNT
-        max_amount = Config.MAX_TRADE_AMOUNT
-        
-        # Risk multiplier based on confidence
-        if confidence >= 90:
-            multiplier = 1.0
-        elif confidence >= 80:
-            multiplier = 0.8
-        elif confidence >= 70:
-            multiplier = 0.6
-        elif confidence >= 60:
-            multiplier = 0.4
-        else:
-            multiplier = 0.2
-            
-        # Adjust for loss streak
-        if self.loss_streak >= 2:
-            multiplier *= 0.5
-            
-        # Calculate final amount
-        amount = base_amount + (max_amount - base_amount) * multiplier
-        
-        # Round to nearest 50
-        amount = round(amount / 50) * 50
-        
-        # Ensure within bounds
-        return max(Config.MIN_TRADE_AMOUNT, min(Config.MAX_TRADE_AMOUNT, int(amount)))
+        sizes = self._position_sizes[self.loss_streak >= 2]  # Halved during a loss streak
+        return sizes[bisect_right(CONFIDENCE_EDGES, confidence)]
     
     def update_loss_streak(self, trade_result):
         """
@@ -0,0 +1,35 @@
+import asyncio
+from collections import OrderedDict
+from aiolimiter import AsyncLimiter
+from telegram.error import RetryAfter
+from config import Config
+
+# Telegram allows roughly 30 messages/second overall and 1 message/second per chat
+_global_limiter = AsyncLimiter(Config.GLOBAL_MESSAGE_RATE, 1.0)
+_chat_limiters = OrderedDict()  # LRU of per-chat limiters
+
+def _chat_limiter(chat_id):
+    """Per-chat limiter, keeping only the most recently used MAX_CHAT_LIMITERS"""
+    limiter = _chat_limiters.get(chat_id)
+    if limiter is None:
+        limiter = _chat_limiters[chat_id] = AsyncLimiter(1, Config.MESSAGE_INTERVAL)
+        if len(_chat_limiters) > Config.MAX_CHAT_LIMITERS:
+            _chat_limiters.popitem(last=False)
+    else:
+        _chat_limiters.move_to_end(chat_id)
+    return limiter
+
+async def safe_reply(message, text, **kwargs):
+    """
+    Reply to a message within Telegram's rate limits
+    Retries once after the server-provided delay if the bot is still throttled
+    """
+    async with _chat_limiter(message.chat_id), _global_limiter:
+        try:
+            return await message.reply_text(text, **kwargs)
+        except RetryAfter as e:
+            retry_after = e.retry_after
+    
+    await asyncio.sleep(retry_after)
+    async with _chat_limiter(message.chat_id), _global_limiter:
+        return await message.reply_text(text, **kwargs)
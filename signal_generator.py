@@ -1,31 +1,35 @@
 import numpy as np
-import pandas as pd
 from datetime import datetime, timedelta
 import random
+import time
 from config import Config
+from signal_kernel import _compute_all
+
+_RNG = np.random.default_rng()  # Seeded once from OS entropy and reused
 
 class SignalGenerator:
     def __init__(self):
         self.data_points = 100  # Number of recent data points to analyze
+        self._cache = (None, None)  # (signal, cooldown bucket) of the last computed signal
         
     def generate_signal(self):
         """
         Generate a trading signal for Crypto IDX using simulated market data
         Includes dynamic trade duration recommendations based on volatility and signal strength
+        Signals are reused within the same SIGNAL_COOLDOWN window
         """
+        bucket = int(time.time() // Config.SIGNAL_COOLDOWN)
+        cached_signal, cached_bucket = self._cache
+        if cached_bucket == bucket:
+            return self._copy_signal(cached_signal)
+        
         # Generate synthetic market data for demonstration
         market_data = self._generate_market_data()
         
-        # Technical analysis indicators
-        rsi = self._calculate_rsi(market_data)
-        macd = self._calculate_macd(market_data)
-        bb_position = self._calculate_bollinger_bands(market_data)
-        
-        # Calculate volatility for duration recommendations
-        volatility = self._calculate_volatility(market_data)
-        
-        # Combine indicators for signal
-        signal_strength = self._calculate_signal_strength(rsi, macd, bb_position)
+        # Technical analysis indicators, volatility and combined signal strength
+        rsi, macd, macd_signal, histogram, bb_position, volatility, signal_strength = \
+            _compute_all(market_data)
+        volatility = round(volatility, 3)
         
         # Determine direction and confidence
         direction = "UP" if signal_strength > 0 else "DOWN"
@@ -38,7 +42,7 @@ class SignalGenerator:
         # Calculate optimal trade duration
         duration = self._calculate_optimal_duration(volatility, abs(signal_strength), confidence)
         
-        return {
+        signal = {
             'direction': direction,
             'confidence': round(confidence, 1),
             'duration': duration,
@@ -46,111 +50,34 @@ class SignalGenerator:
             'timestamp': datetime.now(),
             'indicators': {
                 'rsi': rsi,
-                'macd': macd,
+                'macd': {
+                    'macd': macd,
+                    'signal': macd_signal,
+                    'histogram': histogram
+                },
                 'bb_position': bb_position
             }
         }
+        self._cache = (signal, bucket)
+        return self._copy_signal(signal)
     
-    def _generate_market_data(self):
-        """Generate synthetic Crypto IDX price data for testing"""
-        np.random.seed(int(datetime.now().timestamp()))
-        
-        # Generate price series with trend
-        trend = np.random.choice([-1, 1]) * np.random.uniform(0.1, 0.3)
-        noise = np.random.normal(0, 0.5, self.data_points)
-        
-        prices = 100 + np.cumsum(trend + noise)
-        return pd.Series(prices)
-    
-    def _calculate_rsi(self, prices, period=14):
-        """Calculate Relative Strength Index"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.iloc[-1]
-    
-    def _calculate_macd(self, prices, fast=12, slow=26, signal=9):
-        """Calculate MACD indicator"""
-        ema_fast = prices.ewm(span=fast).mean()
-        ema_slow = prices.ewm(span=slow).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
-        
+    def _copy_signal(self, signal):
+        """Copy of a cached signal, nested indicators included, with a fresh timestamp"""
+        indicators = signal['indicators']
         return {
-            'macd': macd_line.iloc[-1],
-            'signal': signal_line.iloc[-1],
-            'histogram': macd_line.iloc[-1] - signal_line.iloc[-1]
+            **signal,
+            'timestamp': datetime.now(),
+            'indicators': {**indicators, 'macd': dict(indicators['macd'])}
         }
     
-    def _calculate_bollinger_bands(self, prices, period=20, std_dev=2):
-        """Calculate Bollinger Bands position"""
-        sma = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
-        
-        current_price = prices.iloc[-1]
-        
-        # Calculate position within bands (-1 to 1)
-        band_range = upper_band.iloc[-1] - lower_band.iloc[-1]
-        position = (current_price - lower_band.iloc[-1]) / band_range
+    def _generate_market_data(self):
+        """Generate synthetic Crypto IDX price data for testing"""
+        # Generate price series with trend
+        trend = _RNG.choice([-1, 1]) * _RNG.uniform(0.1, 0.3)
+        noise = _RNG.standard_normal(self.data_points) * 0.5
         
-        return max(-1, min(1, position))
+        return 100 + np.cumsum(trend + noise)
     
-    def _calculate_signal_strength(self, rsi, macd, bb_position):
-        """Calculate overall signal strength based on indicators"""
-        # RSI signal (oversold/overbought)
-        rsi_signal = 0
-        if rsi < 30:
-            rsi_signal = 1  # Oversold, potential up
-        elif rsi > 70:
-            rsi_signal = -1  # Overbought, potential down
-            
-        # MACD signal
-        macd_signal = 0
-        if macd['histogram'] > 0:
-            macd_signal = 1
-        elif macd['histogram'] < 0:
-            macd_signal = -1
-            
-        # Bollinger Bands signal
-        bb_signal = 0
-        if bb_position > 0.8:
-            bb_signal = -1  # Near upper band
-        elif bb_position < 0.2:
-            bb_signal = 1  # Near lower band
-            
-        # Weighted combination
-        weights = {'rsi': 0.3, 'macd': 0.4, 'bb': 0.3}
-        signal_strength = (
-            weights['rsi'] * rsi_signal +
-            weights['macd'] * macd_signal +
-            weights['bb'] * bb_signal
-        )
-        
-        return signal_strength
-
-    def _calculate_volatility(self, prices, period=20):
-        """Calculate market volatility using ATR (Average True Range) concept"""
-        if len(prices) < period:
-            return 0.5  # Default moderate volatility
-        
-        # Calculate daily returns
-        returns = prices.pct_change().dropna()
-        
-        # Calculate rolling standard deviation of returns
-        volatility = returns.rolling(window=period).std()
-        
-        # Normalize volatility to 0-1 scale
-        current_volatility = volatility.iloc[-1] if not volatility.empty else 0.02
-        normalized_volatility = min(current_volatility * 50, 1.0)  # Scale factor
-        
-        return round(normalized_volatility, 3)
-
     def _calculate_optimal_duration(self, volatility, signal_strength, confidence):
         """
         Calculate optimal trade duration based on market conditions
@@ -0,0 +1,143 @@
+import numpy as np
+from numba import njit
+
+# Indicator parameters
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+MACD_HISTORY = 4 * MACD_SLOW  # points fed to the EMAs
+BB_PERIOD = 20
+BB_STD_DEV = 2
+VOLATILITY_PERIOD = 20
+
+# Signal strength weights
+RSI_WEIGHT = 0.3
+MACD_WEIGHT = 0.4
+BB_WEIGHT = 0.3
+
+
+@njit(cache=True, nogil=True)
+def _ewm(arr, alpha):
+    """Exponentially weighted mean matching pandas' adjusted ewm()"""
+    decay = 1.0 - alpha
+    out = np.empty(arr.shape[0])
+    num = 0.0
+    den = 0.0
+    for i in range(arr.shape[0]):
+        num = arr[i] + decay * num
+        den = 1.0 + decay * den
+        out[i] = num / den
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _window_mean(arr, w):
+    """Mean of the last w points (NaN if there are fewer)"""
+    n = arr.shape[0]
+    if n < w:
+        return np.nan
+    total = 0.0
+    for i in range(n - w, n):
+        total += arr[i]
+    return total / w
+
+
+@njit(cache=True, nogil=True)
+def _window_std(arr, w):
+    """Sample standard deviation (ddof=1) of the last w points (NaN if there are fewer)"""
+    n = arr.shape[0]
+    if n < w:
+        return np.nan
+    mean = _window_mean(arr, w)
+    sq = 0.0
+    for i in range(n - w, n):
+        sq += (arr[i] - mean) ** 2
+    return np.sqrt(sq / (w - 1))
+
+
+@njit(cache=True, nogil=True)
+def _compute_all(prices):
+    """
+    Compute every indicator for a price array in one compiled call
+    Returns (rsi, macd, macd_signal, macd_histogram, bb_position, volatility, strength)
+    """
+    n = prices.shape[0]
+
+    # RSI over the last RSI_PERIOD price changes
+    gain = np.nan
+    loss = np.nan
+    if n > RSI_PERIOD:
+        gain = 0.0
+        loss = 0.0
+        for i in range(n - RSI_PERIOD, n):
+            delta = prices[i] - prices[i - 1]
+            if delta > 0:
+                gain += delta
+            else:
+                loss -= delta
+        gain /= RSI_PERIOD
+        loss /= RSI_PERIOD
+    if loss == 0.0:
+        rsi = 100.0 if gain > 0.0 else np.nan
+    else:
+        rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+
+    # MACD, over enough history for the slow EMA to converge
+    history = prices[max(0, n - MACD_HISTORY):]
+    ema_fast = _ewm(history, 2.0 / (MACD_FAST + 1))
+    ema_slow = _ewm(history, 2.0 / (MACD_SLOW + 1))
+    macd_line = ema_fast - ema_slow
+    signal_line = _ewm(macd_line, 2.0 / (MACD_SIGNAL + 1))
+    macd = macd_line[-1]
+    macd_signal = signal_line[-1]
+    histogram = macd - macd_signal
+
+    # Bollinger Bands position (-1 to 1)
+    sma = _window_mean(prices, BB_PERIOD)
+    std = _window_std(prices, BB_PERIOD)
+    lower_band = sma - std * BB_STD_DEV
+    band_range = 2.0 * std * BB_STD_DEV
+    if band_range == 0.0:
+        bb_position = 0.5  # Flat window, price sits mid-band
+    else:
+        bb_position = (prices[-1] - lower_band) / band_range
+    if bb_position > 1.0:
+        bb_position = 1.0
+    elif bb_position < -1.0:
+        bb_position = -1.0
+
+    # Volatility, normalized to 0-1 scale
+    if n < VOLATILITY_PERIOD:
+        volatility = 0.5  # Default moderate volatility
+    else:
+        window = prices[-(VOLATILITY_PERIOD + 1):]
+        returns = (window[1:] - window[:-1]) / window[:-1]
+        volatility = min(_window_std(returns, VOLATILITY_PERIOD) * 50.0, 1.0)
+
+    # Signal strength
+    rsi_signal = 0
+    if rsi < 30:
+        rsi_signal = 1  # Oversold, potential up
+    elif rsi > 70:
+        rsi_signal = -1  # Overbought, potential down
+
+    macd_signal_dir = 0
+    if histogram > 0:
+        macd_signal_dir = 1
+    elif histogram < 0:
+        macd_signal_dir = -1
+
+    bb_signal = 0
+    if bb_position > 0.8:
+        bb_signal = -1  # Near upper band
+    elif bb_position < 0.2:
+        bb_signal = 1  # Near lower band
+
+    strength = (
+        RSI_WEIGHT * rsi_signal +
+        MACD_WEIGHT * macd_signal_dir +
+        BB_WEIGHT * bb_signal
+    )
+
+    return rsi, macd, macd_signal, histogram, bb_position, volatility, strength
@@ -6,13 +6,15 @@ This script demonstrates the core features without requiring Telegram
 
 import sys
 import os
+import json
+import tempfile
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from signal_generator import SignalGenerator
 from risk_manager import RiskManager
 from trade_history import TradeHistory
 from datetime import datetime
-import pytz
+from tz import IST
 
 def test_signal_generation():
     """Test signal generation"""
@@ -73,12 +75,48 @@ def test_trade_history():
     print(f"   Total Profit: ₹{stats['total_profit']}")
     print()
 
+def test_legacy_history_import():
+    """Test that both legacy history files are imported on upgrade"""
+    print("🔄 Testing Legacy History Import...")
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            old_trades = [
+                {'direction': 'UP', 'amount': 200, 'profit_loss': 180, 'trade_id': i,
+                 'timestamp': '2025-08-19T10:00:00+05:30'}
+                for i in range(1, 6)
+            ]
+            with open('trade_history.json', 'w') as f:
+                json.dump(old_trades, f)
+            with open('trade_history.jsonl', 'w') as f:
+                for i in range(1, 4):
+                    f.write(json.dumps({'direction': 'DOWN', 'amount': 150, 'profit_loss': -150, 'trade_id': i,
+                                        'timestamp': '2025-08-20T10:00:00+05:30'}) + '\n')
+            
+            history = TradeHistory()
+            total_trades = history.get_statistics()['total_trades']
+            history.conn.close()
+            
+            # A second start must not import the files again
+            history = TradeHistory()
+            reopened_trades = history.get_statistics()['total_trades']
+            history.conn.close()
+        finally:
+            os.chdir(cwd)
+    
+    assert total_trades == 8, f"expected 8 imported trades, got {total_trades}"
+    assert reopened_trades == 8, f"expected 8 trades after restart, got {reopened_trades}"
+    
+    print(f"✅ Imported {total_trades} trades from trade_history.json and trade_history.jsonl")
+    print()
+
 def test_ist_timezone():
     """Test IST timezone handling"""
     print("🔄 Testing IST Timezone...")
     
-    ist = pytz.timezone('Asia/Kolkata')
-    current_time = datetime.now(ist)
+    current_time = datetime.now(IST)
     
     print(f"✅ Current IST Time: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print()
@@ -94,6 +132,7 @@ def main():
         test_signal_generation()
         test_risk_management()
         test_trade_history()
+        test_legacy_history_import()
         
         print("✅ All tests completed successfully!")
         print("\n📱 To start the Telegram bot:")
@@ -1,51 +1,150 @@
 import json
+import mmap
 import os
+import sqlite3
 from datetime import datetime
-import pytz
-from config import Config
+from tz import IST
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Trade dict keys and the table columns they are stored in
+_COLUMNS = (
+    ('trade_id', 'id'),
+    ('timestamp', 'ts'),
+    ('direction', 'direction'),
+    ('amount', 'amount'),
+    ('result', 'result'),
+    ('profit_loss', 'pl'),
+    ('duration', 'duration')
+)
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+CREATE TABLE IF NOT EXISTS trades(
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    direction TEXT,
+    amount INTEGER,
+    result TEXT,
+    pl NUMERIC NOT NULL DEFAULT 0,
+    duration INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_day ON trades(substr(ts, 1, 10));
+"""
+
+# Ids are always assigned by SQLite, in insertion order
+_INSERT = "INSERT INTO trades(ts, direction, amount, result, pl, duration) VALUES (?, ?, ?, ?, ?, ?)"
+
+# PRAGMA user_version once the legacy history has been imported
+_LEGACY_IMPORTED = 1
+
+def _row_values(trade):
+    """Column values for a trade dict, in _INSERT order"""
+    return (
+        trade.get('timestamp'),
+        trade.get('direction'),
+        trade.get('amount'),
+        trade.get('result'),
+        trade.get('profit_loss', 0),
+        trade.get('duration')
+    )
+
+def _row_to_trade(row):
+    """Convert a trades row back into a trade dict, omitting empty columns"""
+    return {key: row[column] for key, column in _COLUMNS if row[column] is not None}
 
 class TradeHistory:
     def __init__(self):
-        self.history_file = 'trade_history.json'
-        self.max_history_size = 1000
-        self.trades = self._load_history()
-        
-    def _load_history(self):
-        """Load trade history from file"""
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return []
-        return []
+        self.db_file = 'trades.db'
+        self.legacy_history_file = 'trade_history.jsonl'
+        self.legacy_json_file = 'trade_history.json'  # Pre-JSON-Lines format
+        self.conn = sqlite3.connect(self.db_file, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self._import_legacy_history()
     
-    def _save_history(self):
-        """Save trade history to file"""
+    def _load_legacy_history(self):
+        """Load trades from the old JSON-Lines history file"""
+        trades = []
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.trades[-self.max_history_size:], f, indent=2, default=str)
-        except Exception as e:
-            print(f"Error saving history: {e}")
+            if not os.path.getsize(self.legacy_history_file):
+                return trades
+            # Map the file and hand each line's bytes straight to the decoder
+            with open(self.legacy_history_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        trades.append(_loads(line))
+                    except ValueError:
+                        continue  # Skip a partially written line
+        except OSError:
+            return []
+        return trades
+    
+    def _load_legacy_json(self):
+        """Load trades from the original JSON array history file"""
+        try:
+            with open(self.legacy_json_file, 'rb') as f:
+                trades = _loads(f.read())
+        except (OSError, ValueError):
+            return []
+        return trades if isinstance(trades, list) else []
+    
+    def _import_legacy_history(self):
+        """
+        Import the legacy JSON array and JSON-Lines histories once, oldest format first
+        Legacy trade ids are not reused since older versions could repeat them
+        """
+        legacy_sources = (
+            (self.legacy_json_file, self._load_legacy_json),
+            (self.legacy_history_file, self._load_legacy_history)
+        )
+        loaders = [load for path, load in legacy_sources if os.path.exists(path)]
+        if not loaders:
+            return
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] >= _LEGACY_IMPORTED:
+            return
+        
+        trades = [t for load in loaders for t in load() if isinstance(t, dict) and t.get('timestamp')]
+        try:
+            with self.conn:
+                self.conn.execute("BEGIN")
+                self.conn.executemany(_INSERT, map(_row_values, trades))
+                # Recorded in the same transaction, so a failed import is retried
+                self.conn.execute(f"PRAGMA user_version = {_LEGACY_IMPORTED}")
+        except sqlite3.Error as e:
+            print(f"Error importing history: {e}")
     
     def add_trade(self, trade_data):
         """
         Add a new trade to history
         trade_data: dict with trade details
         """
-        ist = pytz.timezone(Config.TIMEZONE)
-        trade_data['timestamp'] = datetime.now(ist).isoformat()
-        trade_data['trade_id'] = len(self.trades) + 1
-        
-        self.trades.append(trade_data)
-        self._save_history()
+        trade_data['timestamp'] = datetime.now(IST).isoformat()
         
+        try:
+            cursor = self.conn.execute(_INSERT, _row_values(trade_data))
+            trade_data['trade_id'] = cursor.lastrowid
+        except sqlite3.Error as e:
+            print(f"Error saving history: {e}")
+    
     def get_recent_trades(self, count=10):
         """Get recent trades"""
-        recent = self.trades[-count:]
+        rows = self.conn.execute(
+            "SELECT * FROM trades ORDER BY id DESC LIMIT ?", (count,)
+        ).fetchall()
         formatted_trades = []
         
-        for trade in recent:
+        for trade in map(_row_to_trade, reversed(rows)):
             timestamp = trade.get('timestamp', 'Unknown')
             direction = trade.get('direction', 'Unknown')
             amount = trade.get('amount', 0)
@@ -63,12 +162,16 @@ class TradeHistory:
                 f"💰 **Result**: {profit_text} {'Profit' if profit_loss >= 0 else 'Loss'}"
             )
             formatted_trades.append(formatted_trade)
-            
+        
         return formatted_trades
     
     def get_statistics(self):
         """Get trading statistics"""
-        if not self.trades:
+        total_trades, winning_trades, total_profit, largest_win, largest_loss = self.conn.execute(
+            "SELECT COUNT(*), SUM(pl >= 0), SUM(pl), MAX(pl), MIN(pl) FROM trades"
+        ).fetchone()
+        
+        if not total_trades:
             return {
                 'total_trades': 0,
                 'win_rate': 0,
@@ -78,16 +181,8 @@ class TradeHistory:
                 'largest_loss': 0
             }
         
-        total_trades = len(self.trades)
-        winning_trades = [t for t in self.trades if t.get('profit_loss', 0) >= 0]
-        losing_trades = [t for t in self.trades if t.get('profit_loss', 0) < 0]
-        
-        win_rate = (len(winning_trades) / total_trades) * 100 if total_trades > 0 else 0
-        total_profit = sum(t.get('profit_loss', 0) for t in self.trades)
-        average_profit = total_profit / total_trades if total_trades > 0 else 0
-        
-        largest_win = max([t.get('profit_loss', 0) for t in self.trades], default=0)
-        largest_loss = min([t.get('profit_loss', 0) for t in self.trades], default=0)
+        win_rate = (winning_trades / total_trades) * 100
+        average_profit = total_profit / total_trades
         
         return {
             'total_trades': total_trades,
@@ -96,53 +191,55 @@ class TradeHistory:
             'average_profit': round(average_profit, 2),
             'largest_win': largest_win,
             'largest_loss': largest_loss,
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades)
+            'winning_trades': winning_trades,
+            'losing_trades': total_trades - winning_trades
         }
     
     def get_daily_summary(self, date=None):
         """Get summary for a specific date"""
         if date is None:
-            ist = pytz.timezone(Config.TIMEZONE)
-            date = datetime.now(ist).date()
-            
+            date = datetime.now(IST).date()
+        
         date_str = str(date)
-        daily_trades = [t for t in self.trades if t.get('timestamp', '').startswith(date_str)]
+        trades, total_profit, winning_trades = self.conn.execute(
+            "SELECT COUNT(*), SUM(pl), SUM(pl >= 0) FROM trades WHERE substr(ts, 1, 10) = ?",
+            (date_str,)
+        ).fetchone()
         
-        if not daily_trades:
+        if not trades:
             return None
-            
-        total_profit = sum(t.get('profit_loss', 0) for t in daily_trades)
-        win_rate = (len([t for t in daily_trades if t.get('profit_loss', 0) >= 0]) / len(daily_trades)) * 100
+        
+        win_rate = (winning_trades / trades) * 100
         
         return {
             'date': date_str,
-            'trades': len(daily_trades),
+            'trades': trades,
             'profit': total_profit,
             'win_rate': round(win_rate, 2)
         }
     
     def clear_history(self):
         """Clear all trade history"""
-        self.trades = []
-        if os.path.exists(self.history_file):
-            os.remove(self.history_file)
+        self.conn.execute("DELETE FROM trades")
+        for legacy_file in (self.legacy_history_file, self.legacy_json_file):
+            if os.path.exists(legacy_file):
+                os.remove(legacy_file)
     
     def export_history(self, filename=None):
         """Export trade history to CSV"""
         if filename is None:
             filename = f'trade_history_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-            
-        if not self.trades:
+        
+        if not self.conn.execute("SELECT 1 FROM trades LIMIT 1").fetchone():
             return None
-            
+        
         import csv
         
-        with open(filename, 'w', newline='') as csvfile:
-            if self.trades:
-                fieldnames = self.trades[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self.trades)
-                
+        rows = self.conn.execute("SELECT * FROM trades ORDER BY id")
+        
+        with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=[key for key, _ in _COLUMNS])
+            writer.writeheader()
+            writer.writerows(map(_row_to_trade, rows))
+        
         return filename
\ No newline at end of file
@@ -0,0 +1,5 @@
+from zoneinfo import ZoneInfo
+from config import Config
+
+# Shared IST tzinfo; ZoneInfo instances are cached by the stdlib
+IST = ZoneInfo(Config.TIMEZONE)